@@ -93,6 +93,7 @@ import typer
 from typing_extensions import Annotated
 
 from msfabricutils import get_fabric_bearer_token
+from msfabricutils.core.http_client import get_http_client
 from msfabricutils.core.operations import wait_for_long_running_operation
 from msfabricutils.common.remove_none import remove_none
 from msfabricutils.common.shorten_dict_values import shorten_dict_values
@@ -180,7 +181,7 @@ def {{ module_name | replace('-', '_') }}_{{ name | replace('-', '_') }}(
         typer.echo(f"Headers:\\n{json.dumps(shorten_dict_values(headers, 35), indent=2)}\\n")
         typer.confirm("Do you want to run the command?", abort=True)
 
-    response = requests.request(method=method, url=url, json=data, headers=headers)
+    response = get_http_client().request(method=method, url=url, json=data, headers=headers)
     # response.raise_for_status()
     
     match response.status_code:
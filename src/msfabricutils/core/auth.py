@@ -1,8 +1,58 @@
+import base64
+import json
 import os
+import threading
+import time
 
+from azure.core.credentials import AccessToken
 from azure.core.exceptions import ClientAuthenticationError
 from azure.identity import DefaultAzureCredential
 
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+_credential: DefaultAzureCredential | None = None
+_token_cache: dict[str, AccessToken] = {}
+_token_cache_stats = {"hits": 0, "misses": 0}
+_token_cache_lock = threading.Lock()
+_audience_locks: dict[str, threading.Lock] = {}
+
+
+def _get_credential() -> DefaultAzureCredential:
+    """Returns the process-wide `DefaultAzureCredential`, creating it on first use."""
+    global _credential
+
+    with _token_cache_lock:
+        if _credential is None:
+            _credential = DefaultAzureCredential()
+        return _credential
+
+
+def _get_jwt_claims(token: str) -> dict:
+    """Decodes the (unverified) claims of a JWT access token. Returns an empty dict on failure."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError):
+        return {}
+
+
+def _fetch_access_token(audience: str) -> AccessToken:
+    try:
+        import notebookutils  # type: ignore
+
+        token = notebookutils.credentials.getToken(audience)
+        expires_on = int(_get_jwt_claims(token).get("exp", 0))
+        return AccessToken(token, expires_on)
+    except ModuleNotFoundError:
+        return _get_credential().get_token(f"{audience}/.default")
+
+
+def _is_token_fresh(access_token: AccessToken | None) -> bool:
+    if access_token is None:
+        return False
+    return access_token.expires_on - time.time() > TOKEN_REFRESH_MARGIN_SECONDS
+
 
 def get_access_token(audience: str) -> str:
     """
@@ -13,16 +63,69 @@ def get_access_token(audience: str) -> str:
     and attempts to use the `notebookutils` library to get the token. If the library
     is not available, it falls back to using the `DefaultAzureCredential` from the Azure SDK
     to fetch the token.
+
+    Tokens are cached process-wide per audience and reused until they are within
+    `TOKEN_REFRESH_MARGIN_SECONDS` of expiring, at which point a new token is acquired.
+    A single `DefaultAzureCredential` instance is shared by all audiences.
+    The cache is thread-safe; concurrent callers for the same audience wait for a single acquisition.
     """
 
-    try:
-        import notebookutils  # type: ignore
+    access_token = _token_cache.get(audience)
+    if _is_token_fresh(access_token):
+        with _token_cache_lock:
+            _token_cache_stats["hits"] += 1
+        return access_token.token
 
-        token = notebookutils.credentials.getToken(audience)
-    except ModuleNotFoundError:
-        token = DefaultAzureCredential().get_token(f"{audience}/.default").token
+    with _token_cache_lock:
+        audience_lock = _audience_locks.setdefault(audience, threading.Lock())
+
+    with audience_lock:
+        # Another thread may have refreshed the token while we were waiting for the lock.
+        access_token = _token_cache.get(audience)
+        if _is_token_fresh(access_token):
+            with _token_cache_lock:
+                _token_cache_stats["hits"] += 1
+            return access_token.token
+
+        access_token = _fetch_access_token(audience)
+
+        with _token_cache_lock:
+            _token_cache[audience] = access_token
+            _token_cache_stats["misses"] += 1
+
+    return access_token.token
+
+
+def get_token_cache_info() -> dict[str, int]:
+    """
+    Retrieves statistics for the access token cache.
+
+    Returns:
+        A dictionary with the number of cache `hits`, `misses` and the number of cached audiences (`size`).
 
-    return token
+    Example:
+        ```python
+        from msfabricutils.core.auth import get_token_cache_info
+
+        get_token_cache_info()
+        {"hits": 42, "misses": 1, "size": 1}
+        ```
+    """
+    with _token_cache_lock:
+        return {**_token_cache_stats, "size": len(_token_cache)}
+
+
+def clear_token_cache() -> None:
+    """
+    Removes all cached access tokens and resets the cache statistics.
+
+    The shared credential instance is kept, so the next token acquisition can still
+    benefit from any caching done by the Azure SDK.
+    """
+    with _token_cache_lock:
+        _token_cache.clear()
+        _token_cache_stats["hits"] = 0
+        _token_cache_stats["misses"] = 0
 
 
 def get_onelake_access_token() -> str:
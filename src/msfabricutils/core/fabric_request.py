@@ -3,6 +3,7 @@ import logging
 import requests
 
 from msfabricutils.core.auth import get_fabric_bearer_token
+from msfabricutils.core.http_client import get_http_client
 
 
 def paginated_get_request(endpoint: str, data_key: str) -> list[dict[str, str]]:
@@ -33,7 +34,7 @@ def paginated_get_request(endpoint: str, data_key: str) -> list[dict[str, str]]:
     while True:
         params = {"continuationToken": continuation_token} if continuation_token else {}
 
-        response = requests.get(f"{base_url}/{endpoint}", headers=headers, params=params)
+        response = get_http_client().get(f"{base_url}/{endpoint}", headers=headers, params=params)
         response.raise_for_status()
         data: dict = response.json()
 
@@ -77,7 +78,7 @@ def get_item_from_paginated_get_request(endpoint: str, data_key: str, item_key:
     while True:
         params = {"continuationToken": continuation_token} if continuation_token else {}
 
-        response = requests.get(f"{base_url}/{endpoint}", headers=headers, params=params)
+        response = get_http_client().get(f"{base_url}/{endpoint}", headers=headers, params=params)
         response.raise_for_status()
         data: dict = response.json()
 
@@ -115,7 +116,7 @@ def get_request(endpoint: str, content_only: bool = True) -> requests.Response |
     headers = {"Authorization": f"Bearer {token}"}
     params = {}
 
-    response = requests.get(f"{base_url}/{endpoint}", headers=headers, params=params)
+    response = get_http_client().get(f"{base_url}/{endpoint}", headers=headers, params=params)
 
     if content_only:
         if response.status_code >= 400:
@@ -149,7 +150,7 @@ def post_request(endpoint: str, data: dict[str, str], content_only: bool = True)
     token = get_fabric_bearer_token()
     headers = {"Authorization": f"Bearer {token}"}
 
-    response = requests.post(f"{base_url}/{endpoint}", headers=headers, json=data)
+    response = get_http_client().post(f"{base_url}/{endpoint}", headers=headers, json=data)
 
     if content_only:
         if response.status_code >= 400:
@@ -183,7 +184,7 @@ def patch_request(endpoint: str, data: dict[str, str], content_only: bool = True
     token = get_fabric_bearer_token()
     headers = {"Authorization": f"Bearer {token}"}
 
-    response = requests.patch(f"{base_url}/{endpoint}", headers=headers, json=data)
+    response = get_http_client().patch(f"{base_url}/{endpoint}", headers=headers, json=data)
 
     if content_only:
         if response.status_code >= 400:
@@ -214,7 +215,7 @@ def delete_request(endpoint: str) -> requests.Response:
     token = get_fabric_bearer_token()
     headers = {"Authorization": f"Bearer {token}"}
 
-    response = requests.delete(f"{base_url}/{endpoint}", headers=headers)
+    response = get_http_client().delete(f"{base_url}/{endpoint}", headers=headers)
     if response.status_code >= 400:
         logging.error(f"Request failed with status code {response.status_code}: {response.json()}")
     response.raise_for_status()
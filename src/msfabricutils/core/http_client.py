@@ -0,0 +1,170 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class FabricHttpClient:
+    """A pooled HTTP client used for all requests to the Fabric REST API.
+
+    Connections are kept alive and reused between requests, so repeated calls
+    (i.e. paginated listings or bulk scripts) only pay the TCP and TLS handshake once
+    per pooled connection.
+
+    Args:
+        pool_connections (int): The number of connection pools to cache, one per host. Defaults to 10.
+        pool_maxsize (int): The maximum number of connections kept alive per host. Defaults to 10.
+        connect_timeout (float | None): Timeout in seconds for establishing a connection.
+            Defaults to None, i.e. no timeout.
+        read_timeout (float | None): Timeout in seconds for waiting on the server to send data.
+            Defaults to None, i.e. no timeout, as definition and upload requests can be slow.
+        per_thread_sessions (bool): Whether each thread gets its own `requests.Session`.
+            Defaults to False, in which case a single session is shared by all threads.
+
+    Example:
+        ```python
+        from msfabricutils.core.http_client import get_http_client
+
+        client = get_http_client()
+        response = client.get("https://api.fabric.microsoft.com/v1/workspaces", headers=headers)
+        ```
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        per_thread_sessions: bool = False,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.per_thread_sessions = per_thread_sessions
+
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._session: requests.Session | None = None
+        self._sessions: list[requests.Session] = []
+
+    @property
+    def timeout(self) -> tuple[float | None, float | None] | None:
+        """The `(connect, read)` timeout passed to every request, or None if no timeout is set."""
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+        return (self.connect_timeout, self.read_timeout)
+
+    @property
+    def session(self) -> requests.Session:
+        """The `requests.Session` for the calling thread."""
+        if self.per_thread_sessions:
+            session = getattr(self._local, "session", None)
+            if session is None:
+                session = self._create_session()
+                self._local.session = session
+            return session
+
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        with self._lock:
+            self._sessions.append(session)
+
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request using the pooled session.
+
+        Args:
+            method (str): The HTTP method, i.e. `get` or `post`.
+            url (str): The URL to send the request to.
+            **kwargs: Additional keyword arguments passed to `requests.Session.request`.
+
+        Returns:
+            The response from the request.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("get", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("post", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("patch", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("delete", url, **kwargs)
+
+    def close(self) -> None:
+        """Closes all sessions and their pooled connections."""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+            self._session = None
+        self._local = threading.local()
+
+
+_http_client: FabricHttpClient | None = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> FabricHttpClient:
+    """
+    Retrieves the process-wide `FabricHttpClient`, creating it with default settings on first use.
+
+    Returns:
+        The shared HTTP client.
+    """
+    global _http_client
+
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = FabricHttpClient()
+    return _http_client
+
+
+def configure_http_client(**kwargs) -> FabricHttpClient:
+    """
+    Replaces the process-wide `FabricHttpClient` with a new client.
+
+    The previous client is not closed, so requests already in flight on other threads
+    are not interrupted; its pooled connections are released once it is garbage-collected.
+    Requests started after this call use the new client.
+
+    Args:
+        **kwargs: Keyword arguments passed to `FabricHttpClient`.
+
+    Returns:
+        The new shared HTTP client.
+
+    Example:
+        ```python
+        from msfabricutils.core.http_client import configure_http_client
+
+        configure_http_client(pool_maxsize=32, read_timeout=300, per_thread_sessions=True)
+        ```
+    """
+    global _http_client
+
+    with _http_client_lock:
+        _http_client = FabricHttpClient(**kwargs)
+        return _http_client
@@ -6,6 +6,7 @@ import typer
 from msfabricutils import get_fabric_bearer_token
 from msfabricutils.common.remove_none import remove_none
 from msfabricutils.common.shorten_dict_values import shorten_dict_values
+from msfabricutils.core.http_client import get_http_client
 from msfabricutils.core.operations import wait_for_long_running_operation
 
 
@@ -53,7 +54,7 @@ def data_pipeline_create(
         typer.echo(f"Headers:\n{json.dumps(shorten_dict_values(headers, 35), indent=2)}\n")
         typer.confirm("Do you want to run the command?", abort=True)
 
-    response = requests.request(method=method, url=url, json=data, headers=headers)
+    response = get_http_client().request(method=method, url=url, json=data, headers=headers)
     # response.raise_for_status()
 
     match response.status_code:
@@ -107,7 +108,7 @@ def data_pipeline_get(
         typer.echo(f"Headers:\n{json.dumps(shorten_dict_values(headers, 35), indent=2)}\n")
         typer.confirm("Do you want to run the command?", abort=True)
 
-    response = requests.request(method=method, url=url, json=data, headers=headers)
+    response = get_http_client().request(method=method, url=url, json=data, headers=headers)
     # response.raise_for_status()
 
     match response.status_code:
@@ -155,7 +156,7 @@ def data_pipeline_list(
         typer.echo(f"Headers:\n{json.dumps(shorten_dict_values(headers, 35), indent=2)}\n")
         typer.confirm("Do you want to run the command?", abort=True)
 
-    response = requests.request(method=method, url=url, json=data, headers=headers)
+    response = get_http_client().request(method=method, url=url, json=data, headers=headers)
     # response.raise_for_status()
 
     match response.status_code:
@@ -207,7 +208,7 @@ def data_pipeline_update(
         typer.echo(f"Headers:\n{json.dumps(shorten_dict_values(headers, 35), indent=2)}\n")
         typer.confirm("Do you want to run the command?", abort=True)
 
-    response = requests.request(method=method, url=url, json=data, headers=headers)
+    response = get_http_client().request(method=method, url=url, json=data, headers=headers)
     # response.raise_for_status()
 
     match response.status_code:
@@ -253,7 +254,7 @@ def data_pipeline_delete(
         typer.echo(f"Headers:\n{json.dumps(shorten_dict_values(headers, 35), indent=2)}\n")
         typer.confirm("Do you want to run the command?", abort=True)
 
-    response = requests.request(method=method, url=url, json=data, headers=headers)
+    response = get_http_client().request(method=method, url=url, json=data, headers=headers)
     # response.raise_for_status()
 
     match response.status_code:
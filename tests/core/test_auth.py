@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+from azure.core.credentials import AccessToken
+
+from msfabricutils.core import auth
+
+
+class FakeCredential:
+    def __init__(self, lifetime: int = 3600):
+        self.lifetime = lifetime
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_token(self, scope: str) -> AccessToken:
+        with self._lock:
+            self.calls += 1
+            return AccessToken(f"{scope}-{self.calls}", int(time.time()) + self.lifetime)
+
+
+@pytest.fixture
+def credential(monkeypatch):
+    credential = FakeCredential()
+    monkeypatch.setattr(auth, "_get_credential", lambda: credential)
+    auth.clear_token_cache()
+    yield credential
+    auth.clear_token_cache()
+
+
+def test_token_is_cached_per_audience(credential):
+    first = auth.get_access_token("https://example.com")
+    second = auth.get_access_token("https://example.com")
+    other = auth.get_access_token("https://other.example.com")
+
+    assert first == second
+    assert other != first
+    assert credential.calls == 2
+    assert auth.get_token_cache_info() == {"hits": 1, "misses": 2, "size": 2}
+
+
+def test_token_is_refreshed_ahead_of_expiry(credential):
+    credential.lifetime = auth.TOKEN_REFRESH_MARGIN_SECONDS - 1
+
+    first = auth.get_access_token("https://example.com")
+    second = auth.get_access_token("https://example.com")
+
+    assert first != second
+    assert credential.calls == 2
+    assert auth.get_token_cache_info()["hits"] == 0
+
+
+def test_token_cache_is_thread_safe(credential):
+    tokens = []
+
+    def get_token():
+        tokens.append(auth.get_access_token("https://example.com"))
+
+    threads = [threading.Thread(target=get_token) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(tokens)) == 1
+    assert credential.calls == 1
+    assert auth.get_token_cache_info() == {"hits": 19, "misses": 1, "size": 1}
+
+
+def test_jwt_claims_are_decoded():
+    token = "eyJhbGciOiJub25lIn0.eyJleHAiOjE3MDAwMDAwMDAsInRpZCI6InRlbmFudCJ9.signature"
+    assert auth._get_jwt_claims(token) == {"exp": 1700000000, "tid": "tenant"}
+    assert auth._get_jwt_claims("not-a-jwt") == {}
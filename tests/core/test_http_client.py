@@ -0,0 +1,71 @@
+import threading
+
+from msfabricutils.core import http_client
+from msfabricutils.core.http_client import FabricHttpClient
+
+
+def test_session_is_shared_between_threads():
+    client = FabricHttpClient()
+    sessions = []
+
+    thread = threading.Thread(target=lambda: sessions.append(client.session))
+    thread.start()
+    thread.join()
+
+    assert sessions[0] is client.session
+
+
+def test_per_thread_sessions():
+    client = FabricHttpClient(per_thread_sessions=True)
+    sessions = []
+
+    thread = threading.Thread(target=lambda: sessions.append(client.session))
+    thread.start()
+    thread.join()
+
+    assert sessions[0] is not client.session
+    assert client.session is client.session
+
+
+def test_session_uses_pool_size():
+    client = FabricHttpClient(pool_connections=2, pool_maxsize=25)
+    adapter = client.session.get_adapter("https://api.fabric.microsoft.com")
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 25
+
+
+def test_request_sets_default_timeout(monkeypatch):
+    client = FabricHttpClient(connect_timeout=1.5, read_timeout=30)
+    calls = []
+    monkeypatch.setattr(client.session, "request", lambda **kwargs: calls.append(kwargs))
+
+    client.get("https://api.fabric.microsoft.com/v1/workspaces")
+    client.post("https://api.fabric.microsoft.com/v1/workspaces", timeout=5)
+
+    assert calls[0]["method"] == "get"
+    assert calls[0]["timeout"] == (1.5, 30)
+    assert calls[1]["timeout"] == 5
+
+
+def test_request_has_no_timeout_by_default(monkeypatch):
+    client = FabricHttpClient()
+    calls = []
+    monkeypatch.setattr(client.session, "request", lambda **kwargs: calls.append(kwargs))
+
+    client.get("https://api.fabric.microsoft.com/v1/workspaces")
+
+    assert calls[0]["timeout"] is None
+
+
+def test_configure_http_client_replaces_shared_client(monkeypatch):
+    monkeypatch.setattr(http_client, "_http_client", None)
+
+    previous_client = http_client.get_http_client()
+    previous_session = previous_client.session
+    client = http_client.configure_http_client(pool_maxsize=4)
+
+    assert client is http_client.get_http_client()
+    assert client is not previous_client
+    assert client.pool_maxsize == 4
+    assert previous_client.session is previous_session